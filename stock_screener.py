@@ -7,10 +7,45 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import re
 import time
 import warnings
 import os
-warnings.filterwarnings('ignore')
+
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:  # yfinance < 0.2.55 reports rate limiting as an HTTP 429 error
+    YFRateLimitError = None
+
+# Silence only yfinance's own deprecation noise; pandas/NumPy warnings stay visible
+warnings.filterwarnings('ignore', category=FutureWarning, module='yfinance')
+warnings.filterwarnings('ignore', category=DeprecationWarning, module='yfinance')
+
+# Concurrent Yahoo Finance requests - caps the request rate instead of sleeping
+MAX_WORKERS = 10
+
+# Retries for a single ticker's info request on rate limiting (HTTP 429 during
+# bursts) or network failures; other errors (e.g. 404 for a bad symbol) fail fast
+FETCH_RETRIES = 3
+FETCH_BACKOFF = 0.5  # seconds, doubled after each failed attempt
+
+# On-disk cache of fetched data, so repeated runs skip the network
+CACHE_DIR = './cache'
+CACHE_EXPIRY = 3600  # seconds before cached info is refetched
+
+# Sector/industry/country groups used by the moat and risk criteria
+CONSUMER_SECTORS = frozenset({'Consumer Cyclical', 'Consumer Defensive', 'Communication Services'})
+PATENT_SECTORS = frozenset({'Healthcare', 'Technology'})
+HIGH_SWITCHING_RE = re.compile(r'Software|Banks|Insurance|Utilities')
+NETWORK_RE = re.compile(r'Internet|Payment|Social Media|Marketplace')
+HIGH_TECH_RE = re.compile(r'Semiconductor|Software—Application|Electronics|Consumer Electronics|Internet Content')
+GOV_RE = re.compile(r'Aerospace & Defense|Government')
+CHINA_COUNTRIES = frozenset({'China', 'Hong Kong'})
+
+# Buyback mention in the business summary (no lowercased copy needed)
+BUYBACK_RE = re.compile(r'buyback', re.IGNORECASE)
 
 class StockScorer:
     """
@@ -25,7 +60,7 @@ class StockScorer:
     def __init__(self):
         self.min_passing_score = 7
         
-    def score_financial_metrics(self, stock_info, historical_data):
+    def score_financial_metrics(self, stock_info):
         """
         Score based on financial metrics (max 9 points)
         
@@ -45,11 +80,11 @@ class StockScorer:
         
         try:
             # Get financial data
-            financials = stock_info.get('financialData', {})
+            financials = stock_info.get('financialData') or {}
             key_stats = stock_info.get('defaultKeyStatistics', {})
             
             # 1. EPS Growth (1 point)
-            eps_growth = financials.get('earningsGrowth', 0)
+            eps_growth = _finite(financials.get('earningsGrowth', 0))
             if eps_growth and eps_growth > 0.05:  # >5% growth
                 score += 1
                 details['EPS Growth'] = f"✓ {eps_growth*100:.1f}%"
@@ -57,8 +92,8 @@ class StockScorer:
                 details['EPS Growth'] = f"✗ {eps_growth*100:.1f}%" if eps_growth else "✗ N/A"
             
             # 2. Dividend (0.5-1 point)
-            dividend_rate = stock_info.get('dividendRate', 0)
-            five_year_avg_yield = stock_info.get('fiveYearAvgDividendYield', 0)
+            dividend_rate = _finite(stock_info.get('dividendRate', 0))
+            five_year_avg_yield = _finite(stock_info.get('fiveYearAvgDividendYield', 0))
             
             if dividend_rate and dividend_rate > 0:
                 if five_year_avg_yield and five_year_avg_yield > 0:
@@ -71,21 +106,22 @@ class StockScorer:
                 details['Dividend'] = "✗ No dividend"
             
             # 3. Share Count (1 point) - using shares outstanding
-            shares_outstanding = stock_info.get('sharesOutstanding', 0)
+            shares_outstanding = _finite(stock_info.get('sharesOutstanding', 0))
             if shares_outstanding:
                 # If we can't get historical, give benefit of doubt if there's buyback program
-                if stock_info.get('sharesShort', 0) or 'buyback' in str(stock_info.get('longBusinessSummary', '')).lower():
+                summary = str(stock_info.get('longBusinessSummary') or '')
+                if stock_info.get('sharesShort', 0) or BUYBACK_RE.search(summary):
                     score += 0.5
                     details['Shares'] = "⚠ Unable to verify trend"
             
             # 4. Book Value - skip if data unavailable
-            book_value = stock_info.get('bookValue', 0)
+            book_value = _finite(stock_info.get('bookValue', 0))
             if book_value and book_value > 0:
                 score += 0.5
                 details['Book Value'] = f"⚠ ${book_value:.2f}"
             
             # 5. Free Cash Flow (1 point)
-            free_cash_flow = financials.get('freeCashflow', 0)
+            free_cash_flow = _finite(financials.get('freeCashflow', 0))
             if free_cash_flow and free_cash_flow > 0:
                 score += 1
                 details['FCF'] = f"✓ ${free_cash_flow/1e9:.2f}B"
@@ -93,7 +129,7 @@ class StockScorer:
                 details['FCF'] = "✗ Negative or N/A"
             
             # 6. Net Margin (0.5-1 point)
-            profit_margin = financials.get('profitMargins', 0)
+            profit_margin = _finite(financials.get('profitMargins', 0))
             if profit_margin:
                 if profit_margin > 0.10:  # >10%
                     score += 1
@@ -105,7 +141,7 @@ class StockScorer:
                     details['Net Margin'] = f"✗ {profit_margin*100:.1f}%"
             
             # 7. ROE (0.5-1 point)
-            roe = financials.get('returnOnEquity', 0)
+            roe = _finite(financials.get('returnOnEquity', 0))
             if roe:
                 if 0.15 <= roe <= 0.40:  # 15-40%
                     score += 1
@@ -117,8 +153,8 @@ class StockScorer:
                     details['ROE'] = f"✗ {roe*100:.1f}%"
             
             # 8. Interest Coverage (0.5-1 point)
-            ebit = financials.get('ebit', 0)
-            interest_expense = financials.get('interestExpense', 0)
+            ebit = _finite(financials.get('ebit', 0))
+            interest_expense = _finite(financials.get('interestExpense', 0))
             
             if interest_expense and interest_expense != 0:
                 ic_ratio = abs(ebit / interest_expense) if ebit else 0
@@ -135,7 +171,7 @@ class StockScorer:
                 details['Interest Coverage'] = "✓ No debt"
             
             # 9. Debt/Equity (1 point)
-            debt_to_equity = financials.get('debtToEquity', 0)
+            debt_to_equity = _finite(financials.get('debtToEquity', 0))
             if debt_to_equity is not None:
                 if debt_to_equity < 50:  # <0.5 (expressed as percentage)
                     score += 1
@@ -167,12 +203,12 @@ class StockScorer:
         try:
             sector = stock_info.get('sector', '')
             industry = stock_info.get('industry', '')
-            market_cap = stock_info.get('marketCap', 0)
-            profit_margin = stock_info.get('profitMargins', 0)
+            market_cap = _finite(stock_info.get('marketCap')) or 0
+            profit_margin = _finite(stock_info.get('profitMargins', 0))
             
             # 1. Brand (1 point) - large consumer-facing companies
             if market_cap > 50e9:  # >$50B market cap
-                if sector in ['Consumer Cyclical', 'Consumer Defensive', 'Communication Services']:
+                if sector in CONSUMER_SECTORS:
                     score += 1
                     details['Brand'] = "✓ Large consumer brand"
                 else:
@@ -180,7 +216,7 @@ class StockScorer:
                     details['Brand'] = "⚠ Large company"
             
             # 2. Patents/Licenses (1 point)
-            if sector in ['Healthcare', 'Technology']:
+            if sector in PATENT_SECTORS:
                 score += 1
                 details['Patents'] = f"✓ {sector} sector"
             
@@ -190,14 +226,12 @@ class StockScorer:
                 details['Cost Advantage'] = f"✓ {profit_margin*100:.1f}% margin + scale"
             
             # 4. Switching costs (1 point)
-            high_switching_industries = ['Software', 'Banks', 'Insurance', 'Utilities']
-            if any(ind in industry for ind in high_switching_industries):
+            if HIGH_SWITCHING_RE.search(industry or ''):
                 score += 1
                 details['Switching Cost'] = f"✓ {industry}"
             
             # 5. Network effects (1 point)
-            network_industries = ['Internet', 'Payment', 'Social Media', 'Marketplace']
-            if any(net in industry for net in network_industries):
+            if NETWORK_RE.search(industry or ''):
                 score += 1
                 details['Network Effect'] = f"✓ {industry}"
             
@@ -208,7 +242,7 @@ class StockScorer:
             
             # 7. Longevity (1 point) - based on company age proxy
             # If pays dividend consistently, likely established
-            if stock_info.get('fiveYearAvgDividendYield', 0) > 0:
+            if (_finite(stock_info.get('fiveYearAvgDividendYield')) or 0) > 0:
                 score += 1
                 details['Longevity'] = "✓ Established (dividend history)"
             elif market_cap > 100e9:
@@ -238,20 +272,17 @@ class StockScorer:
             country = stock_info.get('country', '')
             
             # 1. Technology risk
-            high_tech_industries = ['Semiconductor', 'Software—Application', 'Electronics', 
-                                   'Consumer Electronics', 'Internet Content']
-            if any(tech in industry for tech in high_tech_industries):
+            if HIGH_TECH_RE.search(industry or ''):
                 deduction -= 1
                 details['Tech Risk'] = f"✗ -{1} ({industry})"
             
             # 2. Government risk
-            gov_industries = ['Aerospace & Defense', 'Government']
-            if any(gov in industry for gov in gov_industries):
+            if GOV_RE.search(industry or ''):
                 deduction -= 1
                 details['Gov Risk'] = f"✗ -{1} ({industry})"
             
             # 3. China risk
-            if country in ['China', 'Hong Kong']:
+            if country in CHINA_COUNTRIES:
                 deduction -= 1
                 details['China Risk'] = f"✗ -{1} (Chinese company)"
                 
@@ -260,6 +291,101 @@ class StockScorer:
         
         return deduction, details
     
+    def financial_scores(self, df):
+        """
+        Vectorized score_financial_metrics() over a frame of info_record() rows
+        
+        Returns: array of financial scores, one per row
+        """
+        return _score_financials(
+            _numeric(df['eps_growth']),
+            _numeric(df['dividend_rate']),
+            _numeric(df['five_year_avg_yield']),
+            _numeric(df['shares_outstanding'], fill=0),
+            df['buyback_hint'].eq(True).to_numpy(),
+            _numeric(df['book_value']),
+            _numeric(df['free_cash_flow']),
+            _numeric(df['net_margin']),
+            _numeric(df['roe']),
+            _numeric(df['ebit'], fill=0),
+            _numeric(df['interest_expense'], fill=0),
+            _numeric(df['debt_to_equity']),
+        )
+    
+    def moat_scores(self, df):
+        """
+        Vectorized score_competitive_moat() over a frame of info_record() rows
+        
+        Returns: array of moat scores, one per row
+        """
+        sector = df['sector']
+        industry = df['industry']
+        market_cap = _numeric(df['market_cap'], fill=0)
+        profit_margin = _numeric(df['profit_margin'])
+        five_year_avg_yield = _numeric(df['five_year_avg_yield'])
+        
+        # 1. Brand
+        consumer = sector.isin(CONSUMER_SECTORS).to_numpy()
+        score = np.where(market_cap > 50e9, np.where(consumer, 1.0, 0.5), 0.0)
+        
+        # 2. Patents/Licenses
+        score += sector.isin(PATENT_SECTORS).to_numpy()
+        
+        # 3. Cost advantage
+        score += (profit_margin > 0.15) & (market_cap > 10e9)
+        
+        # 4. Switching costs
+        score += industry.str.contains(HIGH_SWITCHING_RE, na=False).to_numpy(dtype=bool)
+        
+        # 5. Network effects
+        score += industry.str.contains(NETWORK_RE, na=False).to_numpy(dtype=bool)
+        
+        # 6. Niche market
+        score += np.where((market_cap > 1e9) & (market_cap < 10e9), 0.5, 0.0)
+        
+        # 7. Longevity
+        score += np.where(five_year_avg_yield > 0, 1.0, np.where(market_cap > 100e9, 0.5, 0.0))
+        
+        return score
+    
+    def risk_deductions(self, df):
+        """
+        Vectorized calculate_risk_deductions() over a frame of info_record() rows
+        
+        Returns: array of (non-positive) deductions, one per row
+        """
+        industry = df['industry']
+        
+        deduction = np.zeros(len(df))
+        deduction -= industry.str.contains(HIGH_TECH_RE, na=False).to_numpy(dtype=bool)
+        deduction -= industry.str.contains(GOV_RE, na=False).to_numpy(dtype=bool)
+        deduction -= df['country'].isin(CHINA_COUNTRIES).to_numpy()
+        
+        return deduction
+    
+    def score_frame(self, df):
+        """
+        Score many stocks at once
+        
+        df: one info_record() row per stock. Applies the same criteria as
+        score_stock() with column operations instead of a Python loop per
+        stock; per-criterion details are left to score_stock().
+        
+        Returns: copy of df with the score columns added
+        """
+        financial_score = self.financial_scores(df)
+        moat_score = self.moat_scores(df)
+        risk_deduction = self.risk_deductions(df)
+        total_score = financial_score + moat_score + risk_deduction
+        
+        return df.assign(
+            financial_score=financial_score,
+            moat_score=moat_score,
+            risk_deduction=risk_deduction,
+            total_score=total_score,
+            passing=total_score >= self.min_passing_score,
+        )
+    
     def score_stock(self, ticker):
         """
         Complete scoring for a single stock
@@ -267,15 +393,24 @@ class StockScorer:
         Returns: dict with scores and details
         """
         try:
-            # Fetch stock data
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            
-            # Get historical data for trend analysis
-            hist = stock.history(period="5y")
-            
+            return self.score_info(ticker, fetch_info(ticker))
+        except Exception as e:
+            return {
+                'ticker': ticker,
+                'error': str(e),
+                'total_score': 0,
+                'passing': False
+            }
+    
+    def score_info(self, ticker, info):
+        """
+        Complete scoring for a single stock from its already-fetched info dict
+        
+        Returns: dict with scores and details
+        """
+        try:
             # Calculate scores
-            financial_score, financial_details = self.score_financial_metrics(info, hist)
+            financial_score, financial_details = self.score_financial_metrics(info)
             moat_score, moat_details = self.score_competitive_moat(info)
             risk_deduction, risk_details = self.calculate_risk_deductions(info)
             
@@ -311,6 +446,213 @@ class StockScorer:
             }
 
 
+def _is_transient(error):
+    """
+    Whether a failed info request is worth retrying
+    
+    True for rate limiting, server errors and network failures (connection
+    errors and timeouts from requests/curl_cffi are OSErrors); False for
+    anything else, such as a 404 for a delisted or invalid symbol
+    """
+    if YFRateLimitError is not None and isinstance(error, YFRateLimitError):
+        return True
+    
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status is not None:
+        return status == 429 or status >= 500
+    
+    return isinstance(error, OSError)
+
+
+def fetch_info(ticker):
+    """
+    Fetch the yfinance info dict for a ticker
+    
+    Rate limiting (concurrent bursts occasionally get HTTP 429) and network
+    failures are retried with exponential backoff; other errors are raised
+    immediately. Successful results are cached on disk per ticker for
+    CACHE_EXPIRY seconds, so repeated calls within that window - in the
+    same process (e.g. a notebook) or across script runs - skip the
+    network; failures are not cached.
+    """
+    cache_file = os.path.join(CACHE_DIR, 'info', f"{ticker.replace('/', '_')}.json")
+    
+    try:
+        if time.time() - os.path.getmtime(cache_file) < CACHE_EXPIRY:
+            with open(cache_file, encoding='utf-8') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache entry - fetch it
+    
+    for attempt in range(FETCH_RETRIES):
+        try:
+            info = yf.Ticker(ticker).info
+            break
+        except Exception as e:
+            if attempt == FETCH_RETRIES - 1 or not _is_transient(e):
+                raise
+            time.sleep(FETCH_BACKOFF * 2 ** attempt)
+    
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(info, f, default=str)
+    except OSError as e:
+        print(f"⚠ Could not cache info for {ticker}: {e}")
+    
+    return info
+
+
+# Columns of an info_record() row, plus the fetch error (None on success)
+RECORD_COLUMNS = [
+    'ticker', 'company_name', 'sector', 'industry', 'country', 'market_cap',
+    'current_price', 'dividend_yield', 'beta', 'eps_growth', 'dividend_rate',
+    'five_year_avg_yield', 'shares_outstanding', 'buyback_hint', 'book_value',
+    'free_cash_flow', 'net_margin', 'roe', 'ebit', 'interest_expense',
+    'debt_to_equity', 'profit_margin', 'error',
+]
+
+
+def info_record(ticker, info):
+    """
+    Flatten the info fields used by the scoring criteria into one row
+    
+    Uses the same lookups and defaults as the per-stock scoring methods,
+    so StockScorer.score_frame() matches score_stock()
+    """
+    financials = info.get('financialData') or {}
+    summary = str(info.get('longBusinessSummary') or '')
+    
+    return {
+        'ticker': ticker,
+        'company_name': info.get('longName', ticker),
+        'sector': info.get('sector', 'N/A'),
+        'industry': info.get('industry', 'N/A'),
+        'country': info.get('country', ''),
+        'market_cap': info.get('marketCap', 0),
+        'current_price': info.get('currentPrice', 0),
+        'dividend_yield': info.get('dividendYield', 0),
+        'beta': info.get('beta', 0),
+        # Financial criteria
+        'eps_growth': financials.get('earningsGrowth', 0),
+        'dividend_rate': info.get('dividendRate', 0),
+        'five_year_avg_yield': info.get('fiveYearAvgDividendYield', 0),
+        'shares_outstanding': info.get('sharesOutstanding', 0),
+        'buyback_hint': bool(info.get('sharesShort', 0) or BUYBACK_RE.search(summary)),
+        'book_value': info.get('bookValue', 0),
+        'free_cash_flow': financials.get('freeCashflow', 0),
+        'net_margin': financials.get('profitMargins', 0),
+        'roe': financials.get('returnOnEquity', 0),
+        'ebit': financials.get('ebit', 0),
+        'interest_expense': financials.get('interestExpense', 0),
+        'debt_to_equity': financials.get('debtToEquity', 0),
+        # Moat criteria
+        'profit_margin': info.get('profitMargins', 0),
+    }
+
+
+def _numeric(series, fill=np.nan):
+    """
+    Column as a contiguous float64 array; missing, non-numeric or non-finite
+    values become fill
+    """
+    values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.ascontiguousarray(np.where(np.isfinite(values), values, fill))
+
+
+def _finite(value):
+    """
+    Info field as a float, or None if missing, non-numeric or non-finite
+    
+    Per-stock counterpart of _numeric(), so both scoring paths treat NaN,
+    inf and junk values as missing
+    """
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if np.isfinite(value) else None
+
+
+def _score_financials(eps_growth, dividend_rate, five_year_avg_yield, shares_outstanding,
+                      buyback_hint, book_value, free_cash_flow, net_margin, roe, ebit,
+                      interest_expense, debt_to_equity):
+    """
+    Financial scores for aligned float64 arrays (one element per stock)
+    
+    Criteria are accumulated in place into a single output array. Each
+    still allocates a temporary boolean mask (plus one float array for the
+    interest coverage ratio), but no per-criterion float scores. Tiered
+    criteria are sums of half-point masks (e.g. >5% and >10% margin each
+    add 0.5).
+    """
+    scores = np.zeros(len(eps_growth))
+    
+    # 1. EPS Growth
+    scores += eps_growth > 0.05
+    
+    # 2. Dividend: 0.5 for paying, 0.5 more with a 5yr history
+    paying = dividend_rate > 0
+    np.add(scores, 0.5, out=scores, where=paying)
+    np.add(scores, 0.5, out=scores, where=paying & (five_year_avg_yield > 0))
+    
+    # 3. Share Count
+    np.add(scores, 0.5, out=scores, where=(shares_outstanding != 0) & buyback_hint)
+    
+    # 4. Book Value
+    np.add(scores, 0.5, out=scores, where=book_value > 0)
+    
+    # 5. Free Cash Flow
+    scores += free_cash_flow > 0
+    
+    # 6. Net Margin: 0.5 above 5%, 0.5 more above 10%
+    np.add(scores, 0.5, out=scores, where=net_margin > 0.05)
+    np.add(scores, 0.5, out=scores, where=net_margin > 0.10)
+    
+    # 7. ROE: 0.5 for 10-40%, 0.5 more for 15-40%
+    roe_cap = roe <= 0.40
+    np.add(scores, 0.5, out=scores, where=(roe >= 0.10) & roe_cap)
+    np.add(scores, 0.5, out=scores, where=(roe >= 0.15) & roe_cap)
+    
+    # 8. Interest Coverage: full point without interest expense
+    no_interest = interest_expense == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ic_ratio = np.abs(ebit / interest_expense)
+    scores += no_interest
+    np.add(scores, 0.5, out=scores, where=~no_interest & (ic_ratio > 5))
+    np.add(scores, 0.5, out=scores, where=~no_interest & (ic_ratio > 10))
+    
+    # 9. Debt/Equity
+    scores += debt_to_equity < 50
+    
+    return scores
+
+
+def _text_formatter(width):
+    """
+    Cell formatter: truncate text to width and left-align it (missing = N/A)
+    """
+    return lambda value: f"{str(value if pd.notna(value) else 'N/A')[:width]:<{width}}"
+
+
+def _format_price(price, width=10):
+    """
+    Cell formatter for prices: left-aligned to width (missing or zero = N/A)
+    """
+    text = f"${price:.2f}" if pd.notna(price) and price else 'N/A'
+    return f"{text:<{width}}"
+
+
+def _format_columns(df, formatters):
+    """
+    Apply cell formatters to columns ahead of to_string()
+    
+    to_string()'s own formatters argument skips NaN cells, so missing
+    values would print as a bare, misaligned NaN
+    """
+    return df.assign(**{col: df[col].astype(object).map(fmt) for col, fmt in formatters.items()})
+
+
 def get_all_us_stocks():
     """
     Get list of all US-listed stocks from CSV file
@@ -321,8 +663,6 @@ def get_all_us_stocks():
     
     print("Loading tickers from data/nasdaqtraded.csv...")
     
-    stocks = set()
-    
     try:
         # Read tickers from CSV file
         csv_path = 'data/nasdaqtraded.csv'
@@ -346,7 +686,12 @@ def get_all_us_stocks():
         # Remove any empty strings
         tickers = [t for t in tickers if t and len(t) > 0]
         
-        stocks.update(tickers)
+        # Remove duplicates so no ticker is fetched twice
+        stocks = sorted(set(tickers))
+        
+        duplicates = len(tickers) - len(stocks)
+        if duplicates:
+            print(f"⚠ Removed {duplicates} duplicate tickers")
         
         print(f"✓ Loaded {len(stocks)} tickers from CSV file")
         
@@ -365,7 +710,7 @@ def get_all_us_stocks():
         print(f"Error reading CSV file: {e}")
         return []
     
-    return sorted(list(stocks))
+    return stocks
 
 
 def main():
@@ -387,48 +732,66 @@ def main():
         print("\n❌ No stocks loaded. Exiting.")
         return None
     
+    # Each ticker must be fetched and scored exactly once
+    assert len(set(stock_list)) == len(stock_list), "ticker list contains duplicates"
+    
     # Score all stocks
     print(f"\nScoring {len(stock_list)} stocks...")
     print("This may take several minutes...\n")
     
-    results = []
+    # Fetch info for every ticker concurrently, collecting results column-wise
+    results = {column: [] for column in RECORD_COLUMNS}
+    infos = {}
     
-    for i, ticker in enumerate(stock_list, 1):
-        print(f"[{i}/{len(stock_list)}] Analyzing {ticker}...", end=" ")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(fetch_info, ticker): ticker for ticker in stock_list}
         
-        try:
-            result = scorer.score_stock(ticker)
-            results.append(result)
-            
-            if 'error' in result:
-                print(f"✗ Error: {result['error']}")
-            else:
-                status = "✓ PASS" if result['passing'] else "✗ FAIL"
-                print(f"{status} (Score: {result['total_score']}/16)")
+        for i, future in enumerate(as_completed(futures), 1):
+            ticker = futures[future]
+            print(f"[{i}/{len(stock_list)}] Fetching {ticker}...", end=" ")
             
-            # Rate limiting - be nice to Yahoo Finance
-            time.sleep(0.5)
+            try:
+                infos[ticker] = future.result()
+                record = info_record(ticker, infos[ticker])
+                print("✓")
+            except Exception as e:
+                print(f"✗ Failed: {e}")
+                record = {'ticker': ticker, 'error': str(e)}
             
-        except Exception as e:
-            print(f"✗ Failed: {e}")
-            results.append({
-                'ticker': ticker,
-                'error': str(e),
-                'total_score': 0,
-                'passing': False
-            })
-    
-    # Convert to DataFrame
-    df = pd.DataFrame(results)
-    
-    # Filter to only valid results (exclude rows with 'error' key)
-    if 'error' in df.columns:
-        df_valid = df[df['error'].isna()].copy()
-    else:
-        df_valid = df.copy()
-    
-    # Sort by total score
-    df_valid = df_valid.sort_values('total_score', ascending=False)
+            for column, values in results.items():
+                values.append(record.get(column))
+    
+    # Build the frame exactly once from the collected columns; growing it with
+    # pd.concat inside the loop above would copy everything on every ticker.
+    # Low-cardinality text columns as categoricals: smaller, faster to group,
+    # and the industry regexes run once per category rather than per row
+    df = pd.DataFrame(results).astype({'sector': 'category', 'industry': 'category',
+                                        'country': 'category'})
+    
+    # Score all stocks at once
+    df = scorer.score_frame(df)
+    
+    # Filter to only valid results (exclude rows with a fetch error) and sort
+    # by total score; sort_values returns a new frame, so no defensive copy
+    df_valid = df[df['error'].isna()].sort_values('total_score', ascending=False)
+    
+    # Per-criterion details, only for passing stocks, from the info dicts
+    # fetched above (so they match the scores and need no second request)
+    details = {
+        ticker: scorer.score_info(ticker, infos[ticker])
+        for ticker in df_valid.loc[df_valid['passing'], 'ticker']
+    }
+    df_valid = df_valid.assign(**{
+        col: df_valid['ticker'].map(lambda t: details.get(t, {}).get(col))
+        for col in ['financial_details', 'moat_details', 'risk_details']
+    })
+    
+    # Filters used by both the CSVs and the printout, computed once
+    # (subsets of the sorted frame stay sorted by score)
+    passing = df_valid['passing'].to_numpy(dtype=bool)
+    price = _numeric(df_valid['current_price'])
+    top_scorers = df_valid[passing]
+    budget_stocks = df_valid[passing & (price > 0) & (price < 20)]
     
     # Save results
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -450,32 +813,33 @@ def main():
     print(f"\n✓ Saved main results to: {csv_file}")
     
     # 2. Save top scorers CSV (>=7 points)
-    top_scorers = df_valid[df_valid['passing'] == True]
     top_scorers_file = f'{output_dir}/stock_scores_top_scorers_{timestamp}.csv'
     top_scorers[summary_cols].to_csv(top_scorers_file, index=False)
     print(f"✓ Saved top scorers to: {top_scorers_file}")
     
     # 3. Save budget-friendly stocks CSV
-    budget_stocks = df_valid[
-        (df_valid['passing'] == True) & 
-        (df_valid['current_price'] < 20) &
-        (df_valid['current_price'] > 0)
-    ].sort_values('total_score', ascending=False)
-    
     if len(budget_stocks) > 0:
         budget_file = f'{output_dir}/stock_scores_budget_friendly_{timestamp}.csv'
         budget_stocks[summary_cols].to_csv(budget_file, index=False)
         print(f"✓ Saved budget-friendly stocks to: {budget_file}")
     
     # 4. Save by sector (separate CSV for each sector)
-    for sector in df_valid['sector'].unique():
-        if pd.notna(sector):
-            sector_df = df_valid[df_valid['sector'] == sector]
-            # Clean sector name for filename
-            clean_sector = sector.replace(' ', '_').replace('&', 'and').replace('/', '_')
-            sector_file = f'{output_dir}/stock_scores_sector_{clean_sector}_{timestamp}.csv'
-            sector_df[summary_cols].to_csv(sector_file, index=False)
-            print(f"✓ Saved {sector} sector to: {sector_file}")
+    def save_sector(sector, sector_df):
+        # Clean sector name for filename
+        clean_sector = sector.replace(' ', '_').replace('&', 'and').replace('/', '_')
+        sector_file = f'{output_dir}/stock_scores_sector_{clean_sector}_{timestamp}.csv'
+        sector_df[summary_cols].to_csv(sector_file, index=False)
+        return sector_file
+    
+    # One pass to split by sector; files are written concurrently
+    sector_groups = df_valid.groupby('sector', observed=True, sort=False)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            sector: executor.submit(save_sector, sector, sector_df)
+            for sector, sector_df in sector_groups
+        }
+        for sector, future in futures.items():
+            print(f"✓ Saved {sector} sector to: {future.result()}")
     
     # Print summary
     print("\n" + "="*80)
@@ -490,13 +854,17 @@ def main():
     print("\n" + "="*80)
     print("TOP 20 STOCKS (Highest Scores)")
     print("="*80)
-    print(f"\n{'Rank':<6}{'Ticker':<8}{'Company':<40}{'Score':<8}{'Price':<12}")
-    print("-" * 80)
     
-    for i, row in enumerate(df_valid.head(20).itertuples(), 1):
-        company = row.company_name[:38] if hasattr(row, 'company_name') else row.ticker
-        price = f"${row.current_price:.2f}" if hasattr(row, 'current_price') and row.current_price else 'N/A'
-        print(f"{i:<6}{row.ticker:<8}{company:<40}{row.total_score:<8}{price:<12}")
+    top_20 = df_valid.head(20)
+    print()
+    top_20 = _format_columns(top_20.assign(rank=np.arange(1, len(top_20) + 1)), {
+        'ticker': _text_formatter(6), 'company_name': _text_formatter(38),
+        'total_score': _text_formatter(5), 'current_price': _format_price,
+    })
+    print(top_20.to_string(
+        columns=['rank', 'ticker', 'company_name', 'total_score', 'current_price'],
+        header=['Rank', 'Ticker', 'Company', 'Score', 'Price'],
+        index=False, justify='left'))
     
     # Print stocks suitable for your budget ($6,890)
     print("\n" + "="*80)
@@ -504,21 +872,17 @@ def main():
     print("(Score ≥7, Price <$20 for reasonable collateral)")
     print("="*80)
     
-    budget_stocks = df_valid[
-        (df_valid['passing'] == True) & 
-        (df_valid['current_price'] < 20) &
-        (df_valid['current_price'] > 0)
-    ].sort_values('total_score', ascending=False)
-    
     if len(budget_stocks) > 0:
-        print(f"\n{'Ticker':<8}{'Company':<35}{'Price':<12}{'Score':<8}{'Sector':<20}")
-        print("-" * 90)
-        
-        for row in budget_stocks.head(15).itertuples():
-            company = row.company_name[:33] if hasattr(row, 'company_name') else row.ticker
-            price = f"${row.current_price:.2f}"
-            sector = row.sector[:18] if hasattr(row, 'sector') else 'N/A'
-            print(f"{row.ticker:<8}{company:<35}{price:<12}{row.total_score:<8}{sector:<20}")
+        print()
+        budget_top = _format_columns(budget_stocks.head(15), {
+            'ticker': _text_formatter(6), 'company_name': _text_formatter(33),
+            'current_price': _format_price, 'total_score': _text_formatter(5),
+            'sector': _text_formatter(18),
+        })
+        print(budget_top.to_string(
+            columns=['ticker', 'company_name', 'current_price', 'total_score', 'sector'],
+            header=['Ticker', 'Company', 'Price', 'Score', 'Sector'],
+            index=False, justify='left'))
     else:
         print("\nNo stocks found matching criteria")
     
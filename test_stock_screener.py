@@ -0,0 +1,101 @@
+"""
+Tests that StockScorer.score_frame() (vectorized) and the per-stock scoring
+methods implement the same criteria
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from stock_screener import StockScorer, info_record
+
+# Values each info field can take, including the awkward ones Yahoo returns
+# (missing, None, NaN, inf, strings)
+JUNK = [None, np.nan, np.inf, -np.inf, 'Infinity']
+FINANCIAL_FIELDS = {
+    'earningsGrowth': [0, 0.01, 0.1, -0.2],
+    'freeCashflow': [0, 1e9, -5e8],
+    'profitMargins': [0, 0.03, 0.07, 0.2],
+    'returnOnEquity': [0, 0.1, 0.12, 0.15, 0.2, 0.4, 0.5],
+    'ebit': [0, 1e9, -1e8],
+    'interestExpense': [0, 1e7, 2e8, 5e8],
+    'debtToEquity': [0, 30, 80],
+}
+INFO_FIELDS = {
+    'dividendRate': [0, 1.5],
+    'fiveYearAvgDividendYield': [0, 2.1],
+    'sharesOutstanding': [0, 1e9],
+    'sharesShort': [0, 1e6],
+    'longBusinessSummary': ['', 'Runs a BuyBack program', 'nothing'],
+    'bookValue': [0, 12.0, -3.0],
+    'sector': ['Technology', 'Healthcare', 'Consumer Cyclical', 'Energy', None],
+    'industry': ['Software—Application', 'Banks - Regional', 'Internet Content & Information',
+                 'Aerospace & Defense', 'Oil & Gas', 'Semiconductors', 'Payment Services', None],
+    'country': ['United States', 'China', 'Hong Kong', None],
+    'marketCap': [0, 5e8, 5e9, 2e10, 6e10, 2e11],
+    'profitMargins': [0, 0.1, 0.2],
+}
+TEXT_FIELDS = {'longBusinessSummary', 'sector', 'industry', 'country'}
+
+
+def random_fields(rng, fields):
+    values = {}
+    for key, choices in fields.items():
+        roll = rng.random()
+        if roll < 0.7:
+            values[key] = rng.choice(choices)
+        elif roll < 0.85 and key not in TEXT_FIELDS:
+            values[key] = rng.choice(JUNK)
+        # else: field missing
+    return values
+
+
+def random_info(rng):
+    info = random_fields(rng, INFO_FIELDS)
+    if rng.random() < 0.9:
+        info['financialData'] = random_fields(rng, FINANCIAL_FIELDS)
+    return info
+
+
+def per_stock_scores(scorer, info):
+    scores = []
+    for method in (scorer.score_financial_metrics, scorer.score_competitive_moat,
+                   scorer.calculate_risk_deductions):
+        score, details = method(info)
+        assert 'Error' not in details, details
+        scores.append(score)
+    return scores
+
+
+def score_frame_for(scorer, infos):
+    # Built the same way as in main()
+    df = pd.DataFrame([info_record(f'T{i}', info) for i, info in enumerate(infos)])
+    df = df.astype({'sector': 'category', 'industry': 'category', 'country': 'category'})
+    return scorer.score_frame(df)
+
+
+def test_score_frame_matches_per_stock_methods():
+    rng = random.Random(0)
+    scorer = StockScorer()
+    infos = [random_info(rng) for _ in range(3000)]
+
+    frame = score_frame_for(scorer, infos)
+
+    for info, row in zip(infos, frame.itertuples()):
+        expected = per_stock_scores(scorer, info)
+        actual = [row.financial_score, row.moat_score, row.risk_deduction]
+        assert actual == expected, info
+
+
+def test_non_finite_interest_expense_counts_as_no_debt():
+    scorer = StockScorer()
+    infos = [{'financialData': {'interestExpense': value, 'ebit': 1e9}}
+             for value in (np.nan, np.inf, None)]
+
+    frame = score_frame_for(scorer, infos)
+
+    for info, row in zip(infos, frame.itertuples()):
+        _, details = scorer.score_financial_metrics(info)
+        assert details['Interest Coverage'] == "✓ No debt"
+        assert row.financial_score == per_stock_scores(scorer, info)[0]